@@ -8,9 +8,13 @@ Repo and README: https://github.com/adamatan/advent-of-code-2021
 Copyright (c) 2021 Adam Matan and distributed under the MIT License.
 """
 
-from collections import Counter
 from enum import Enum
 
+try:
+    from .compact import encode_bit_rows
+except ImportError:
+    from compact import encode_bit_rows
+
 
 class Gas(Enum):
     OXYGEN = 0
@@ -24,6 +28,33 @@ def get_input():
     return lines
 
 
+def get_bit_rows(input_filename="input/03.txt"):
+    """Reads the input file directly into integer-encoded rows, without keeping
+    the lines around. Returns the rows and the number of digits in each row.
+    >>> rows, width = get_bit_rows()
+    >>> len(rows), width
+    (1000, 12)
+    """
+    with open(input_filename) as f:
+        return encode_bit_rows(f)
+
+
+def most_and_least_common_bit(rows, width, position):
+    """Returns the most and least common bit at the given position of the rows,
+    where position 0 is the leftmost (most significant) digit.
+    If both bits are equally common, 1 is considered the most common.
+    >>> most_and_least_common_bit([0b000, 0b011, 0b110], 3, 0)
+    (0, 1)
+    >>> most_and_least_common_bit([0b000, 0b011], 3, 1)
+    (1, 0)
+    """
+    mask = 1 << (width - 1 - position)
+    ones = sum(1 for row in rows if row & mask)
+    if ones >= len(rows) - ones:
+        return 1, 0
+    return 0, 1
+
+
 def most_and_least_common_digit(lines, position):
     """Returns the most common digit in every position of the input lines.
     For example, ("000", "011", "110", 0) would give ("0", "1") - as the most
@@ -31,14 +62,24 @@ def most_and_least_common_digit(lines, position):
     >>> most_and_least_common_digit(["000", "011", "110"], 0)
     ('0', '1')
     """
-    # Assuming that all lines are of the same length
-    common_digit = Counter([l[position] for l in lines])
-    # If digits are equally common, prefer "1" as the most common
-    if common_digit.most_common()[0][1] == common_digit.most_common()[1][1]:
-        return "1", "0"
-    most_common_digit = common_digit.most_common()[0][0]
-    least_common_digit = common_digit.most_common()[-1][0]
-    return most_common_digit, least_common_digit
+    rows, width = encode_bit_rows(lines)
+    most_common, least_common = most_and_least_common_bit(rows, width, position)
+    return str(most_common), str(least_common)
+
+
+def gamma_and_epsilon_rates(rows, width):
+    """Returns two numbers, built from the most and least common bits at every
+    position of the rows.
+    >>> gamma_and_epsilon_rates([0b000, 0b011, 0b110], 3)
+    (2, 5)
+    """
+    gamma = 0
+    for position in range(width):
+        most_common, _ = most_and_least_common_bit(rows, width, position)
+        gamma = (gamma << 1) | most_common
+    # The least common bit is always the opposite of the most common one
+    epsilon = gamma ^ ((1 << width) - 1)
+    return gamma, epsilon
 
 
 def most_and_least_common_digit_in_every_position(lines):
@@ -48,14 +89,15 @@ def most_and_least_common_digit_in_every_position(lines):
     >>> most_and_least_common_digit_in_every_position(["000", "011", "110"])
     ('010', '101')
     """
-    # Assuming that all lines are of the same length
-    number_of_digits = len(lines[0])
-    common_digits = [
-        most_and_least_common_digit(lines, i) for i in range(number_of_digits)
-    ]
-    most_common_digits = "".join([c[0] for c in common_digits])
-    least_common_digits = "".join([c[1] for c in common_digits])
-    return most_common_digits, least_common_digits
+    rows, width = encode_bit_rows(lines)
+    gamma, epsilon = gamma_and_epsilon_rates(rows, width)
+    return f"{gamma:0{width}b}", f"{epsilon:0{width}b}"
+
+
+def power_consumption(rows, width) -> int:
+    """Multiplies the gamma and epsilon rates of the integer-encoded rows."""
+    gamma, epsilon = gamma_and_epsilon_rates(rows, width)
+    return gamma * epsilon
 
 
 def part_1(input_lines) -> int:
@@ -67,11 +109,25 @@ def part_1(input_lines) -> int:
     >>> print(part_1(input_lines))
     693486
     """
-    most_common, least_common = most_and_least_common_digit_in_every_position(
-        input_lines
-    )
-    most_common, least_common = int(most_common, 2), int(least_common, 2)
-    return most_common * least_common
+    return power_consumption(*encode_bit_rows(input_lines))
+
+
+def find_rating(rows, width, gas: Gas) -> int:
+    """Finds the oxygen or CO2 rating of the integer-encoded rows, by iteratively
+    keeping only the rows whose n-th bit is the most/least (oxygen/co2) common bit
+    at that position, till we're left with a single row.
+    >>> rows = [0b00100, 0b11110, 0b10110, 0b10111, 0b10101, 0b01111]
+    >>> find_rating(rows, 5, Gas.OXYGEN), find_rating(rows, 5, Gas.CO2)
+    (23, 4)
+    """
+    position = 0
+    while len(rows) > 1:
+        most_common, least_common = most_and_least_common_bit(rows, width, position)
+        criteria = most_common if gas == Gas.OXYGEN else least_common
+        mask = 1 << (width - 1 - position)
+        rows = [row for row in rows if bool(row & mask) == criteria]
+        position += 1
+    return rows[0]
 
 
 def find_oxygen_and_co2_levels(input_lines, gas: Gas) -> int:
@@ -85,16 +141,12 @@ def find_oxygen_and_co2_levels(input_lines, gas: Gas) -> int:
     >>> print(find_oxygen_and_co2_levels(input_lines, Gas.CO2))
     10
     """
-    lines = input_lines.copy()
-    position = 0
-    while len(lines) > 1:
-        most_common, least_common = most_and_least_common_digit(lines, position)
-        criteria = most_common if gas == Gas.OXYGEN else least_common
-        lines = [l for l in lines if l[position] == criteria]
-        position += 1
+    return find_rating(*encode_bit_rows(input_lines), gas)
+
 
-    numerical_value = int(lines[0], 2)
-    return numerical_value
+def life_support_rating(rows, width) -> int:
+    """Multiplies the oxygen and CO2 ratings of the integer-encoded rows."""
+    return find_rating(rows, width, Gas.OXYGEN) * find_rating(rows, width, Gas.CO2)
 
 
 def part_2(input_lines) -> int:
@@ -106,12 +158,10 @@ def part_2(input_lines) -> int:
     >>> print(part_2(input_lines))
     230
     """
-    oxygen = find_oxygen_and_co2_levels(input_lines, Gas.OXYGEN)
-    co2 = find_oxygen_and_co2_levels(input_lines, Gas.CO2)
-    return oxygen * co2
+    return life_support_rating(*encode_bit_rows(input_lines))
 
 
 if __name__ == "__main__":
-    input_lines = get_input()
-    print(part_1(input_lines))
-    print(part_2(input_lines))
+    rows, width = get_bit_rows()
+    print(power_consumption(rows, width))
+    print(life_support_rating(rows, width))
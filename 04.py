@@ -10,15 +10,22 @@ Repo and README: https://github.com/adamatan/advent-of-code-2021
 Copyright (c) 2021 Adam Matan and distributed under the MIT License.
 """
 
-import sys
-from typing import List, Tuple, Set
+from typing import List, Tuple
 import numpy as np
 
+try:
+    from .compact import BoardArray
+except ImportError:
+    from compact import BoardArray
+
 
 class BingoBoard:
-    """A representation of a bingo board.
+    """A representation of a single bingo board.
     The board keeps its numbers as its state, and can check whether the board
-    wins any given lottery numbers."""
+    wins any given lottery numbers. The numbers may be a view into a BoardArray,
+    in which case the board doesn't own a copy of them."""
+
+    __slots__ = ("board",)
 
     def __init__(self, numbers: List[int]) -> None:
         """Converts a flat list of integers into a 5x5 board"""
@@ -26,34 +33,20 @@ class BingoBoard:
 
     def is_winning(self, lottery_numbers):
         """Returns true if the board wins the given lottery numbers."""
-        numbers_as_set = set(lottery_numbers)
-        for row_or_column in self._get_rows_and_columns_as_sets():
-            if row_or_column.issubset(numbers_as_set):
-                return True
-        return False
-
-    def _get_rows_and_columns_as_sets(self) -> List[Set[int]]:
-        """Returns a list of all rows and columns as a list of sets."""
-        rows_and_columns = []
-        for row in self.board:
-            rows_and_columns.append(set(row))
-        for column in self.board.T:
-            rows_and_columns.append(set(column))
-        return rows_and_columns
+        marked = np.isin(self.board, lottery_numbers)
+        return bool(marked.all(axis=0).any() or marked.all(axis=1).any())
 
     def calculate_score(self, lottery_numbers: List[int]) -> int:
         """Returns the score of the board for the given lottery numbers."""
         if not self.is_winning(lottery_numbers):
             raise ValueError("The board does not win the given lottery numbers.")
-        lottery_numbers_set = set(lottery_numbers)
-        board_numbers_set = set(self.board.flatten())
-        unmarked_numbers = board_numbers_set - lottery_numbers_set
-        score = sum(unmarked_numbers) * lottery_numbers[-1]
-        return score
+        unmarked_numbers = self.board[~np.isin(self.board, lottery_numbers)]
+        return int(unmarked_numbers.sum()) * lottery_numbers[-1]
 
     def to_str_with_lottery_numbers_marked(self, lottery_numbers):
         """Debug function.
-        Returns a string representation of the board with the lottery numbers marked with a *"""
+        Returns a string representation of the board with the lottery numbers marked with a *
+        """
         s = ""
         for row in self.board:
             for number in row:
@@ -68,79 +61,91 @@ class BingoBoard:
         return str(f"Bingo board:\n{self.board}")
 
 
-def get_input(input_filename) -> Tuple[List[int], List[BingoBoard]]:
+def get_board_array(input_filename) -> Tuple[List[int], BoardArray]:
     """Reads and parses the input file into:
     1. A list of lottery numbers
-    2. A List of Bingo boards
+    2. All the bingo boards, packed into a single BoardArray
+    >>> lottery_numbers, boards = get_board_array("input/04-small.txt")
+    >>> len(lottery_numbers), len(boards)
+    (27, 3)
     """
     with open(input_filename) as f:
         raw_input = f.read()
-    parts = raw_input.split("\n\n")
+    lottery_part, boards_part = raw_input.split("\n\n", 1)
     # The lottery numbes drawn by the bingo team
-    lottery_numbers = [int(n) for n in parts[0].split(",")]
+    lottery_numbers = [int(n) for n in lottery_part.split(",")]
+    boards = BoardArray([int(n) for n in boards_part.split()])
+    return lottery_numbers, boards
 
-    # The boards, as BingoBoard objects
-    bingo_boards = []
-    for part in parts[1:]:
-        bingo_board_numbers = [int(n) for n in part.split()]
-        bingo_boards.append(BingoBoard(bingo_board_numbers))
+
+def get_input(input_filename) -> Tuple[List[int], List[BingoBoard]]:
+    """Reads and parses the input file into:
+    1. A list of lottery numbers
+    2. A List of Bingo boards, each a view into a shared BoardArray
+    """
+    lottery_numbers, boards = get_board_array(input_filename)
+    bingo_boards = [BingoBoard(boards.board(i)) for i in range(len(boards))]
     return lottery_numbers, bingo_boards
 
 
+def winning_turns(boards: BoardArray, lottery_numbers: List[int]) -> np.ndarray:
+    """Returns, for every board, the index of the lottery number that makes it win.
+    Boards that never win get len(lottery_numbers).
+    >>> lottery_numbers, boards = get_board_array("input/04-small.txt")
+    >>> winning_turns(boards, lottery_numbers).tolist()
+    [13, 14, 11]
+    """
+    never_drawn = len(lottery_numbers)
+    largest_number = max(max(lottery_numbers), int(boards.numbers.max()))
+    draw_turn = np.full(largest_number + 1, never_drawn)
+    # Iterate backwards, so a number drawn twice keeps its first turn
+    for turn in range(len(lottery_numbers) - 1, -1, -1):
+        draw_turn[lottery_numbers[turn]] = turn
+    # The turn in which every cell is marked
+    cell_turns = draw_turn[boards.numbers]
+    # A row or a column wins once its last cell is marked
+    row_turns = cell_turns.max(axis=2).min(axis=1)
+    column_turns = cell_turns.max(axis=1).min(axis=1)
+    return np.minimum(row_turns, column_turns)
+
+
+def board_score(boards: BoardArray, index: int, lottery_numbers: List[int]) -> int:
+    """Returns the score of the board at the given index, for the given lottery numbers."""
+    return BingoBoard(boards.board(index)).calculate_score(lottery_numbers)
+
+
 def part_1(input_filename):
     """
     Solves part 1 of the puzzle.
-    Tries each board with
+    Finds the first board to win, and calculates its score.
 
     >>> part_1("input/04.txt")
     41668
     >>> part_1("input/04-small.txt")
     4512
     """
-    lottery_numbers, bingo_boards = get_input(input_filename)
-    for i in range(5, len(lottery_numbers)):
-        current_lottery_numbers = lottery_numbers[: i + 1]
-        for board in bingo_boards:
-            if board.is_winning(current_lottery_numbers):
-                score = board.calculate_score(current_lottery_numbers)
-                return score
+    lottery_numbers, boards = get_board_array(input_filename)
+    turns = winning_turns(boards, lottery_numbers)
+    first_board = int(turns.argmin())
+    turn = int(turns[first_board])
+    return board_score(boards, first_board, lottery_numbers[: turn + 1])
 
 
 def part_2(input_filename):
     """
     Solves part 2 of the puzzle.
-    Draws numbers till we have a single non-winning board, then draw numbers
-    till that board wins to calculate its score.
+    Finds the last board to win, and calculates its score at the turn it wins.
 
     >>> part_2("input/04-small.txt")
     1924
     >>> part_2("input/04.txt")
     10478
     """
-    lottery_numbers, bingo_boards = get_input(input_filename)
-    remaining_boards = set(bingo_boards)
-    winning_boards = set()
-    i = 5
-
-    # Draw numbers until we have a single non-winning board
-    for i in range(5, len(lottery_numbers)):
-        current_lottery_numbers = lottery_numbers[: i + 1]
-        winning_boards = winning_boards | {
-            b for b in remaining_boards if b.is_winning(current_lottery_numbers)
-        }
-        remaining_boards = remaining_boards - winning_boards
-        if len(winning_boards) == len(bingo_boards) - 1:
-            break
-    assert len(remaining_boards) == 1
-    last_board = remaining_boards.pop()
-
-    # Draw numbers until the last board wins
-    while not last_board.is_winning(current_lottery_numbers):
-        i += 1
-        current_lottery_numbers = lottery_numbers[: i + 1]
-
-    score = last_board.calculate_score(current_lottery_numbers)
-    return score
+    lottery_numbers, boards = get_board_array(input_filename)
+    turns = winning_turns(boards, lottery_numbers)
+    last_board = int(turns.argmax())
+    turn = int(turns[last_board])
+    return board_score(boards, last_board, lottery_numbers[: turn + 1])
 
 
 if __name__ == "__main__":
@@ -9,10 +9,16 @@ Copyright (c) 2021 Adam Matan and distributed under the MIT License.
 """
 
 import re
-from collections import Counter
+from itertools import chain
 from typing import List, Tuple, Set
 from loguru import logger
 from collections import namedtuple
+import numpy as np
+
+try:
+    from .compact import pack_point, unpack_point
+except ImportError:
+    from compact import pack_point, unpack_point
 
 Point = namedtuple("Point", ["x", "y"])
 
@@ -46,6 +52,21 @@ def coordinates_to_points(p1: Point, p2: Point, with_diagonals=False) -> Set[Poi
     >>> coordinates_to_points( Point(0, 0), Point(1, 10), with_diagonals=True)
     set()
     """
+    return {
+        Point(*unpack_point(p))
+        for p in packed_line_points(p1, p2, with_diagonals=with_diagonals)
+    }
+
+
+def packed_line_points(p1: Point, p2: Point, with_diagonals=False) -> range:
+    """Returns the points of a horizontal, vertical or diagonal line, packed as
+    integers (see compact.pack_point). Since packed points along a line are evenly
+    spaced, the points are a plain range, with no per-point objects.
+    >>> [unpack_point(p) for p in packed_line_points(Point(3, 4), Point(1, 4))]
+    [(3, 4), (2, 4), (1, 4)]
+    >>> len(packed_line_points(Point(0, 0), Point(3, 3), with_diagonals=False))
+    0
+    """
     # Vertical line
     if p1.x == p2.x:
         dx = 0
@@ -60,14 +81,9 @@ def coordinates_to_points(p1: Point, p2: Point, with_diagonals=False) -> Set[Poi
         dy = 1 if p1.y < p2.y else -1
     # Neither horizontal, vertical nor diagonal
     else:
-        return set()
-    points = set()
-    p = Point(p1.x, p1.y)
-    while p != Point(p2.x, p2.y):
-        points.add(p)
-        p = Point(p.x + dx, p.y + dy)
-    points.add(p)
-    return points
+        return range(0)
+    step = pack_point(dx, dy)
+    return range(pack_point(p1.x, p1.y), pack_point(p2.x, p2.y) + step, step)
 
 
 def get_input(input_filename: str) -> List[Tuple[Point, Point]]:
@@ -108,15 +124,16 @@ def count_points_that_appear_more_than_once(
     19929
     """
     lines = get_input(input_filename)
-    points: List[Point] = []
-    for line in lines:
-        new_points = coordinates_to_points(line[0], line[1], with_diagonal)
-        points += new_points
-    counter = Counter(points)
+    points = np.fromiter(
+        chain.from_iterable(
+            packed_line_points(line[0], line[1], with_diagonal) for line in lines
+        ),
+        dtype=np.uint32,
+    )
+    _, counts = np.unique(points, return_counts=True)
 
     # All the points that appears more than once in the list
-    duplicate_points = [i for i in counter.items() if i[1] > 1]
-    return len(duplicate_points)
+    return int((counts > 1).sum())
 
 
 def part_1(input_filename: str) -> int:
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compact data representations shared by the daily solutions.
+
+The puzzles create a lot of tiny records - grid points, binary diagnostic rows,
+bingo boards. Keeping each one as a Python object costs far more memory than the
+data itself, so these helpers store them as plain integers or flat arrays instead.
+
+Repo and README: https://github.com/adamatan/advent-of-code-2021
+
+Copyright (c) 2021 Adam Matan and distributed under the MIT License.
+"""
+
+from array import array
+from typing import Iterable, Sequence, Tuple
+import numpy as np
+
+# Number of bits reserved for the y coordinate of a packed point.
+COORDINATE_BITS = 16
+COORDINATE_MASK = (1 << COORDINATE_BITS) - 1
+
+
+def pack_point(x: int, y: int) -> int:
+    """Packs a pair of coordinates into a single integer.
+    Offsets (e.g. a (1, -1) step) pack the same way, so moving a packed point
+    along a line is a plain integer addition.
+    >>> pack_point(3, 4)
+    196612
+    >>> pack_point(3, 4) + pack_point(1, -1) == pack_point(4, 3)
+    True
+    """
+    return (x << COORDINATE_BITS) + y
+
+
+def unpack_point(packed: int) -> Tuple[int, int]:
+    """Unpacks an integer created by pack_point (with non-negative coordinates).
+    >>> unpack_point(pack_point(989, 12))
+    (989, 12)
+    """
+    return packed >> COORDINATE_BITS, packed & COORDINATE_MASK
+
+
+def encode_bit_rows(lines: Iterable[str]) -> Tuple[array, int]:
+    """Encodes lines of binary digits as an array of unsigned integers.
+    Returns the array and the number of digits in each line. Blank lines are skipped.
+    >>> rows, width = encode_bit_rows(["00100", "11110\\n", ""])
+    >>> list(rows), width
+    ([4, 30], 5)
+    """
+    rows = array("I")
+    width = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        width = width or len(line)
+        rows.append(int(line, 2))
+    return rows, width
+
+
+class BoardArray:
+    """A collection of square boards, stored back to back in a single NumPy array.
+    Boards are addressed by their index; board() returns a view into the shared
+    array rather than a copy."""
+
+    __slots__ = ("numbers",)
+
+    def __init__(self, numbers: Sequence[int], size: int = 5) -> None:
+        """Converts a flat list of integers into consecutive size x size boards.
+        >>> boards = BoardArray(range(50))
+        >>> len(boards)
+        2
+        >>> boards.board(1)[0]
+        array([25, 26, 27, 28, 29], dtype=int16)
+        """
+        self.numbers = np.asarray(numbers, dtype=np.int16).reshape(-1, size, size)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def board(self, index: int) -> np.ndarray:
+        """Returns a view of the board at the given index."""
+        return self.numbers[index]
+
+    def __repr__(self) -> str:
+        return f"<BoardArray: {len(self)} boards>"